@@ -43,6 +43,25 @@ class DetectionMethod(str, Enum):
     FALLBACK_DEFAULT = "fallback_default"
 
 
+# YAML rule names -> ChartType enum; names not listed map to ChartType.UNKNOWN
+YAML_CHART_TYPE_MAP: Dict[str, ChartType] = {
+    "column_chart": ChartType.COLUMN,
+    "bar_chart": ChartType.BAR,
+    "line_chart": ChartType.LINE,
+    "area_chart": ChartType.AREA,
+    "pie_chart": ChartType.PIE,
+    "donut_chart": ChartType.DONUT,
+    "scatter_plot": ChartType.SCATTER,
+    "text_table": ChartType.TEXT_TABLE,
+    "table_chart": ChartType.TEXT_TABLE,
+    "histogram": ChartType.HISTOGRAM,
+    "box_plot": ChartType.BOX_PLOT,
+    "treemap": ChartType.TREEMAP,
+    "symbol_map": ChartType.SYMBOL_MAP,
+    "filled_map": ChartType.FILLED_MAP,
+}
+
+
 class TableauChartRuleEngine:
     """
     YAML-based chart type detection engine for Tableau worksheets.
@@ -119,49 +138,12 @@ class TableauChartRuleEngine:
 
     def _build_chart_type_mappings(self) -> Dict[str, ChartType]:
         """Build chart type mappings from YAML config."""
-        mappings = {}
-
         # Get chart types from basic_chart_detection section
         chart_types = self.rules.get("basic_chart_detection", {})
-        for chart_name in chart_types.keys():
-            try:
-                # Map YAML chart names to ChartType enum
-                if chart_name == "column_chart":
-                    mappings[chart_name] = ChartType.COLUMN
-                elif chart_name == "bar_chart":
-                    mappings[chart_name] = ChartType.BAR
-                elif chart_name == "line_chart":
-                    mappings[chart_name] = ChartType.LINE
-                elif chart_name == "area_chart":
-                    mappings[chart_name] = ChartType.AREA
-                elif chart_name == "pie_chart":
-                    mappings[chart_name] = ChartType.PIE
-                elif chart_name == "donut_chart":
-                    mappings[chart_name] = ChartType.DONUT
-                elif chart_name == "scatter_plot":
-                    mappings[chart_name] = ChartType.SCATTER
-                elif chart_name == "text_table":
-                    mappings[chart_name] = ChartType.TEXT_TABLE
-                elif chart_name == "table_chart":
-                    mappings[chart_name] = ChartType.TEXT_TABLE
-                elif chart_name == "histogram":
-                    mappings[chart_name] = ChartType.HISTOGRAM
-                elif chart_name == "box_plot":
-                    mappings[chart_name] = ChartType.BOX_PLOT
-                elif chart_name == "treemap":
-                    mappings[chart_name] = ChartType.TREEMAP
-                elif chart_name == "symbol_map":
-                    mappings[chart_name] = ChartType.SYMBOL_MAP
-                elif chart_name == "filled_map":
-                    mappings[chart_name] = ChartType.FILLED_MAP
-                else:
-                    mappings[chart_name] = ChartType.UNKNOWN
-
-            except Exception as e:
-                self.logger.warning(f"Failed to map chart type {chart_name}: {e}")
-                mappings[chart_name] = ChartType.UNKNOWN
-
-        return mappings
+        return {
+            chart_name: YAML_CHART_TYPE_MAP.get(chart_name, ChartType.UNKNOWN)
+            for chart_name in chart_types
+        }
 
     def detect_chart_type(self, worksheet_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -106,10 +106,7 @@ class FieldDerivationEngine:
             Tableau instance pattern or None
         """
         # Field reference format: model.explore.field_name
-        if "." in field_reference:
-            field_name = field_reference.split(".")[-1]
-        else:
-            field_name = field_reference
+        field_name = field_reference.rpartition(".")[2]
 
         # Check if field name matches tableau instance patterns
         if self._is_tableau_instance_pattern(field_name):
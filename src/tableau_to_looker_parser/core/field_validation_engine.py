@@ -10,6 +10,18 @@ from typing import Dict, List, Set, Optional
 
 logger = logging.getLogger(__name__)
 
+# Field name prefixes produced by Tableau time functions and aggregations
+_TIME_FUNCTION_PREFIXES = (
+    "day_",
+    "hour_",
+    "minute_",
+    "quarter_",
+    "year_",
+    "month_",
+    "week_",
+)
+_AGGREGATION_PREFIXES = ("sum_", "avg_", "count_", "min_", "max_", "median_")
+
 
 class FieldValidationResult:
     """Result of field validation containing missing fields and suggestions."""
@@ -108,7 +120,7 @@ class FieldValidationEngine:
                 for field in fields:
                     if isinstance(field, str) and "." in field:
                         # Extract just the field name part
-                        field_name = field.split(".")[-1]
+                        field_name = field.rpartition(".")[2]
                         field_references.add(field_name)
 
                 # Extract from sorts array
@@ -117,7 +129,7 @@ class FieldValidationEngine:
                     if isinstance(sort, str) and "." in sort:
                         # Remove sort direction and extract field name
                         sort_field = sort.split()[0] if " " in sort else sort
-                        field_name = sort_field.split(".")[-1]
+                        field_name = sort_field.rpartition(".")[2]
                         field_references.add(field_name)
 
         return field_references
@@ -214,21 +226,11 @@ class FieldValidationEngine:
 
     def _is_time_function_pattern(self, field_name: str) -> bool:
         """Check if field name matches time function patterns."""
-        time_patterns = [
-            "day_",
-            "hour_",
-            "minute_",
-            "quarter_",
-            "year_",
-            "month_",
-            "week_",
-        ]
-        return any(field_name.startswith(pattern) for pattern in time_patterns)
+        return field_name.startswith(_TIME_FUNCTION_PREFIXES)
 
     def _is_aggregation_pattern(self, field_name: str) -> bool:
         """Check if field name matches aggregation patterns."""
-        agg_patterns = ["sum_", "avg_", "count_", "min_", "max_", "median_"]
-        return any(field_name.startswith(pattern) for pattern in agg_patterns)
+        return field_name.startswith(_AGGREGATION_PREFIXES)
 
     def _suggest_time_dimension_group(self, field_name: str) -> Dict:
         """Suggest creating a time dimension_group."""
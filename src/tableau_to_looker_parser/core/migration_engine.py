@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -217,8 +218,7 @@ class MigrationEngine:
 
             # Save JSON output
             json_path = output_path / "processed_pipeline_output.json"
-            with open(json_path, "w") as f:
-                json.dump(result, f, indent=2)
+            self._write_json_output(json_path, result)
 
             return result
 
@@ -226,6 +226,38 @@ class MigrationEngine:
             self.logger.error(f"Migration failed: {str(e)}", exc_info=True)
             raise MigrationError(f"Failed to migrate {tableau_file}: {str(e)}")
 
+    def _write_json_output(self, json_path: Path, data: Dict[str, Any]) -> None:
+        """Serialize data to JSON and write it to json_path.
+
+        Serializes to one encoded buffer and writes it in a single call;
+        json.dump() with indent would issue a write() per encoded chunk.
+        The file is written to a temporary sibling and moved into place, so
+        a crash never leaves a truncated output, and the write is skipped
+        entirely when the existing file already has the same content.
+        """
+        payload = json.dumps(data, indent=2).encode("utf-8")
+
+        # Re-runs over an unchanged workbook produce identical output
+        try:
+            if (
+                json_path.stat().st_size == len(payload)
+                and json_path.read_bytes() == payload
+            ):
+                self.logger.debug(f"Output unchanged, skipping write: {json_path}")
+                return
+        except FileNotFoundError:
+            pass
+
+        tmp_path = json_path.with_name(json_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, json_path)
+        except BaseException:
+            # Don't leave a partial temp file next to the output
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def _build_field_metadata(self, elements: List[Dict]) -> Dict[str, Dict[str, str]]:
         """
         Build comprehensive field metadata for parser.
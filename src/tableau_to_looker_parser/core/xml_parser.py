@@ -1,9 +1,12 @@
+import logging
 import zipfile
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Union
 from lxml import etree as ET
 from lxml.etree import Element
 
+logger = logging.getLogger(__name__)
+
 
 class TableauParseError(Exception):
     """Exception raised for errors during Tableau file parsing."""
@@ -97,30 +100,40 @@ class TableauXMLParser:
         tree = ET.parse(file_path)
         root = tree.getroot()
 
-        # Debug object graphs
-        for graph in root.findall(".//object-graph"):
-            # Print object count
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_object_graphs(root)
+
+        return root
+
+    def _log_object_graphs(self, root: Element) -> None:
+        """Log object-graph objects and relationships as a single debug record.
+
+        Args:
+            root: ElementTree root element
+        """
+        lines = []
+        for graph in root.iter("object-graph"):
             objects = graph.find("objects")
             if objects is not None:
                 for obj in objects:
-                    print(
+                    lines.append(
                         f"  - {obj.tag} id={obj.get('id')} caption={obj.get('caption')}"
                     )
 
-            # Print relationship count
             rels = graph.find("relationships")
             if rels is not None:
                 for rel in rels:
-                    print(f"  - {rel.tag}")
+                    lines.append(f"  - {rel.tag}")
                     expr = rel.find("expression")
                     if expr is not None:
-                        for e in expr.findall("expression"):
+                        for e in expr.iterfind("expression"):
                             if e.text:
-                                print(f"      - Text: {e.text}")
+                                lines.append(f"      - Text: {e.text}")
                             if e.get("op"):
-                                print(f"      - Op: {e.get('op')}")
+                                lines.append(f"      - Op: {e.get('op')}")
 
-        return root
+        if lines:
+            logger.debug("Object graphs:\n%s", "\n".join(lines))
 
     def _parse_twbx_file(self, file_path: Path) -> Element:
         """Parse a packaged .twbx file.
@@ -15,6 +15,8 @@ Key improvements over v1:
 import zipfile
 import ast
 import html
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Union, Any
 from lxml import etree as ET
@@ -24,6 +26,119 @@ from .tableau_style_extractor import TableauStyleExtractor
 
 logger = logging.getLogger(__name__)
 
+# Tableau field type -> datatype, shared by every _infer_datatype_from_type call
+_DATATYPE_MAP = {
+    "quantitative": "real",
+    "nominal": "string",
+    "ordinal": "string",
+    "temporal": "date",
+}
+
+# Tableau layout analysis -> LookML layout type, as ordered
+# (analysis key, matching value, layout) rules where the first match wins
+_LAYOUT_TYPE_RULES = (
+    # Mixed horizontal/vertical flows with distribution strategies
+    ("has_complex_flows", True, "newspaper"),
+    # Primarily horizontal flow layout
+    ("primary_flow", "horizontal", "grid"),
+    # Primarily vertical flow layout (dashboard style)
+    ("primary_flow", "vertical", "newspaper"),
+    # Elements with distribute-evenly strategy
+    ("has_distributed_elements", True, "newspaper"),
+    # Elements with fixed positioning
+    ("has_fixed_elements", True, "grid"),
+    # Many elements suggest structured layout
+    ("element_density", "high", "newspaper"),
+)
+
+# Precompiled XPath queries for hot per-worksheet / per-dashboard lookups;
+# single-element lookups select the first match only, like find()
+_XP_TITLE = ET.XPath("(.//layout-options/title/formatted-text/run)[1]")
+_XP_HAS_TOTALS = ET.XPath("boolean(.//totals)")
+_XP_MARK_STYLE = ET.XPath("(.//style-rule[@element='mark'])[1]")
+_XP_FILTER_ZONES = ET.XPath(".//zone[@type-v2='filter']")
+_XP_GROUPFILTERS = ET.XPath(".//groupfilter")
+
+_STRIP_BACKSLASH_TABLE = str.maketrans("", "", "\\")
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_MULTI_UNDERSCORE_RE = re.compile(r"_+")
+
+
+def _style_str(value: Optional[str]) -> Optional[str]:
+    return value
+
+
+def _style_int(default: int):
+    def coerce(value: Optional[str]) -> int:
+        return int(value) if value and value.isdigit() else default
+
+    return coerce
+
+
+# Tableau zone coordinates use 100000 as full scale
+_TABLEAU_FULL_SCALE = 100000
+
+# Style defaults for a dashboard zone; copied per zone and then overridden
+_ZONE_STYLE_DEFAULTS = {
+    "background_color": None,
+    "border_color": None,
+    "border_width": 0,
+    "border_style": "none",
+    "margin": 4,
+    "padding": 0,
+}
+
+# zone-style <format attr=...> -> (style key, value coercer)
+_ZONE_STYLE_DISPATCH = {
+    "border-color": ("border_color", _style_str),
+    "border-width": ("border_width", _style_int(0)),
+    "border-style": ("border_style", _style_str),
+    "margin": ("margin", _style_int(4)),
+}
+
+
+def _unescape_filter_value(value: str) -> str:
+    """Decode HTML entities and drop Tableau's backslash escapes ("\\%" -> "%")."""
+    if "&" in value:
+        value = html.unescape(value)
+    if "\\" in value:
+        value = value.replace("\\%", "%").translate(_STRIP_BACKSLASH_TABLE)
+    return value
+
+
+@lru_cache(maxsize=2048)
+def _split_field_reference(param: str) -> tuple[str, str, tuple[str, ...]]:
+    """Split "[datasource].[type:name:qualifier]" into its parts.
+
+    Returns (datasource_id, field_reference, components). Cached because a
+    workbook only references a small set of distinct fields from its filters.
+    """
+    head, sep, rest = param.partition("].[")
+    if sep:
+        # Handle federated references: [datasource].[field]
+        datasource_id = head.strip("[")
+        field_reference = rest.strip("]")
+    else:
+        datasource_id = ""
+        field_reference = param.strip("[]")
+
+    return datasource_id, field_reference, tuple(field_reference.split(":"))
+
+
+@lru_cache(maxsize=4096)
+def _clean_name(name: str) -> str:
+    """Convert name to LookML-safe format.
+
+    Cached at module level because the same field and zone names recur
+    throughout a workbook (filters, cards, axes, pane styles).
+    """
+    # Remove brackets, convert to lowercase, replace special chars with underscore
+    clean = name.strip("[]").lower()
+    clean = _NON_ALNUM_RE.sub("_", clean)
+    clean = _MULTI_UNDERSCORE_RE.sub("_", clean)  # Remove duplicate underscores
+    return clean.strip("_")
+
 
 class TableauParseError(Exception):
     """Exception raised for errors during Tableau file parsing."""
@@ -397,9 +512,6 @@ class TableauXMLParserV2:
                     column_ref = lookup_column.strip("[]")
                     name = f"{column_ref}_{derivation}_Derived"
 
-                    if name.lower() == "none_avg_derived40":
-                        print(name)
-
                     # if role == "measure" and derivation == "User":
                     # derivation = "AGG"
 
@@ -665,9 +777,6 @@ class TableauXMLParserV2:
                 "is_internal": self._is_internal_field(col),
             }
 
-            if col.get("caption") == "Rolling 24":
-                print(col.get("caption"))
-
             # Check for calculations (CALCULATED FIELDS)
             calc_element = col.find("calculation")
             if calc_element is not None:
@@ -1017,11 +1126,7 @@ class TableauXMLParserV2:
             table_aliases = relationship.get("table_aliases", {})
             for alias, actual_table in table_aliases.items():
                 # Clean the actual table name (remove brackets and schema)
-                clean_actual = (
-                    actual_table.split(".")[-1].strip("[]")
-                    if "." in actual_table
-                    else actual_table.strip("[]")
-                )
+                clean_actual = actual_table.rpartition(".")[2].strip("[]")
 
                 # If this points to an actual table, map the alias
                 if clean_actual in actual_tables or alias in actual_tables:
@@ -1940,9 +2045,6 @@ class TableauXMLParserV2:
         for worksheet in root.findall(".//worksheet"):
             worksheet_name = worksheet.get("name")
 
-            if worksheet_name == "Sales By Region":
-                print(f"Worksheet {worksheet_name} has data: {worksheet}")
-
             if not worksheet_name:
                 continue
 
@@ -2559,13 +2661,11 @@ class TableauXMLParserV2:
             series_field_source = []
             series_field_chart_type = []
 
-        # Debug print
-        worksheet_name = worksheet.get("name", "")
-        if worksheet_name == "Device TR Ranking":
-            print(
-                f"[DEBUG] Worksheet '{worksheet_name}' chart_type_dict: {chart_type_dict}"
-            )
-            # print(f"[DEBUG] Extracted chart_type: {chart_type}")
+        self.logger.debug(
+            "Worksheet '%s' chart_type_dict: %s",
+            worksheet.get("name", ""),
+            chart_type_dict,
+        )
 
         # Extract encodings - RAW DATA ONLY
         encodings_info = self._extract_pane_encodings(pane)
@@ -2735,145 +2835,6 @@ class TableauXMLParserV2:
 
         return filters
 
-    # ============================================================================
-    # FILTER PARSING HELPER METHODS - FULLY GENERIC & EXTENSIBLE
-    # ============================================================================
-
-    def _parse_filter_card(self, card: Element) -> Optional[Dict]:
-        """Parse worksheet filter card - completely generic.
-
-        No hardcoded values - extracts all attributes for extensibility.
-        """
-        try:
-            param = card.get("param")
-            if not param:
-                return None
-
-            # Parse field reference generically
-            field_info = self._parse_filter_field_reference(param)
-            if not field_info:
-                return None
-
-            # Generic extraction of ALL card attributes
-            filter_config = {
-                "field_name": field_info["field_name"],
-                "field_reference": param,
-                "datasource_id": field_info.get("datasource_id"),
-                "filter_type": "worksheet_card",
-                # Extract ALL attributes generically - no hardcoding
-                **{attr: value for attr, value in card.attrib.items()},
-                "field_info": field_info,
-                "position_context": self._extract_card_position_context(card),
-            }
-
-            return filter_config
-
-        except Exception as e:
-            self.logger.warning(f"Failed to parse filter card: {e}")
-            return None
-
-    def _parse_filter_zone(self, zone: Element) -> Optional[Dict]:
-        """Parse dashboard filter zone - completely generic.
-
-        No hardcoded values - extracts all attributes for extensibility.
-        """
-        try:
-            param = zone.get("param")
-            if not param:
-                return None
-
-            # Parse field reference generically
-            field_info = self._parse_filter_field_reference(param)
-            if not field_info:
-                return None
-
-            # Generic extraction of ALL zone attributes
-            filter_config = {
-                "field_name": field_info["field_name"],
-                "field_reference": param,
-                "datasource_id": field_info.get("datasource_id"),
-                "filter_type": "dashboard_zone",
-                # Extract ALL attributes generically - no hardcoding
-                **{attr: value for attr, value in zone.attrib.items()},
-                "field_info": field_info,
-                "position": self._extract_zone_position(zone)
-                if hasattr(self, "_extract_zone_position")
-                else {},
-            }
-
-            return filter_config
-
-        except Exception as e:
-            self.logger.warning(f"Failed to parse filter zone: {e}")
-            return None
-
-    def _parse_filter_field_reference(self, param: str) -> Optional[Dict]:
-        """Parse filter field reference - completely generic.
-
-        Handles any field reference pattern without hardcoding.
-        """
-        if not param:
-            return None
-
-        try:
-            # Generic parsing of complex field references
-            field_info = {
-                "original_param": param,
-                "clean_param": param.strip("[]"),
-            }
-
-            # Handle federated references: [datasource].[field]
-            if "].[" in param:
-                parts = param.split("].[", 1)
-                field_info["datasource_id"] = parts[0].strip("[")
-                field_reference = parts[1].strip("]")
-            else:
-                field_info["datasource_id"] = ""
-                field_reference = param.strip("[]")
-
-            # Parse field components generically: type:name:qualifier
-            components = field_reference.split(":")
-            field_info["components"] = components
-            field_info["field_name"] = (
-                components[1] if len(components) > 1 else field_reference
-            )
-            field_info["field_type"] = components[0] if len(components) > 0 else ""
-            field_info["field_qualifier"] = components[2] if len(components) > 2 else ""
-
-            # Store all components for extensibility
-            if len(components) > 3:
-                field_info["additional_components"] = components[3:]
-
-            return field_info
-
-        except Exception as e:
-            self.logger.warning(
-                f"Failed to parse filter field reference '{param}': {e}"
-            )
-            return None
-
-    def _extract_card_position_context(self, card: Element) -> Dict:
-        """Extract positioning context for filter card - generic."""
-        context = {}
-
-        try:
-            # Get parent strip info generically
-            parent = card.getparent()
-            if parent is not None:
-                context["parent_tag"] = parent.tag
-                context["parent_attributes"] = dict(parent.attrib)
-
-                # Get grandparent context
-                grandparent = parent.getparent()
-                if grandparent is not None:
-                    context["grandparent_tag"] = grandparent.tag
-                    context["grandparent_attributes"] = dict(grandparent.attrib)
-
-        except Exception:
-            pass
-
-        return context
-
     def _extract_worksheet_actions(self, worksheet: Element) -> List[Dict]:
         """Extract action configuration from worksheet."""
         # This is a placeholder - actions are complex
@@ -3010,45 +2971,34 @@ class TableauXMLParserV2:
 
     def _extract_zone_position(self, zone: Element) -> Dict[str, float]:
         """Extract and normalize zone position."""
-        x = int(zone.get("x", "0"))
-        y = int(zone.get("y", "0"))
-        width = int(zone.get("w", "100000"))
-        height = int(zone.get("h", "100000"))
-
-        # Normalize to 0-1 coordinates (Tableau uses 100000 as full scale)
+        attrib = zone.attrib
+        x = int(attrib.get("x", "0"))
+        y = int(attrib.get("y", "0"))
+        width = int(attrib.get("w", "100000"))
+        height = int(attrib.get("h", "100000"))
+
+        # Normalize to 0-1 coordinates. Divide rather than multiply by 1e-5:
+        # the reciprocal is inexact and would leak 0.30000000000000004-style
+        # values into the generated output.
         return {
-            "x": x / 100000,
-            "y": y / 100000,
-            "width": width / 100000,
-            "height": height / 100000,
+            "x": x / _TABLEAU_FULL_SCALE,
+            "y": y / _TABLEAU_FULL_SCALE,
+            "width": width / _TABLEAU_FULL_SCALE,
+            "height": height / _TABLEAU_FULL_SCALE,
             "z_index": 0,
         }
 
     def _extract_zone_style(self, zone: Element) -> Dict[str, Any]:
         """Extract zone styling information."""
-        style = {
-            "background_color": None,
-            "border_color": None,
-            "border_width": 0,
-            "border_style": "none",
-            "margin": 4,
-            "padding": 0,
-        }
+        style = _ZONE_STYLE_DEFAULTS.copy()
 
         zone_style = zone.find("zone-style")
         if zone_style is not None:
-            for format_elem in zone_style.findall("format"):
-                attr = format_elem.get("attr")
-                value = format_elem.get("value")
-
-                if attr == "border-color":
-                    style["border_color"] = value
-                elif attr == "border-width":
-                    style["border_width"] = int(value) if value.isdigit() else 0
-                elif attr == "border-style":
-                    style["border_style"] = value
-                elif attr == "margin":
-                    style["margin"] = int(value) if value.isdigit() else 4
+            for format_elem in zone_style.iterfind("format"):
+                handler = _ZONE_STYLE_DISPATCH.get(format_elem.get("attr"))
+                if handler:
+                    key, coerce = handler
+                    style[key] = coerce(format_elem.get("value"))
 
         return style
 
@@ -3090,34 +3040,25 @@ class TableauXMLParserV2:
 
     def _clean_name(self, name: str) -> str:
         """Convert name to LookML-safe format."""
-        import re
-
-        # Remove brackets, convert to lowercase, replace special chars with underscore
-        clean = name.strip("[]").lower()
-        clean = re.sub(r"[^a-z0-9]+", "_", clean)
-        clean = re.sub(r"_+", "_", clean)  # Remove duplicate underscores
-        return clean.strip("_")
+        return _clean_name(name)
 
     def _infer_datatype_from_type(self, field_type: str) -> str:
         """Infer datatype from Tableau field type."""
-        type_mapping = {
-            "quantitative": "real",
-            "nominal": "string",
-            "ordinal": "string",
-            "temporal": "date",
-        }
-        return type_mapping.get(field_type, "string")
+        return _DATATYPE_MAP.get(field_type, "string")
 
     def _has_dual_axis(self, worksheet: Element) -> bool:
         """Check if worksheet uses dual axis."""
-        # Look for dual axis indicators in the worksheet XML
-        panes = worksheet.findall(".//pane")
-        return len(panes) > 1
+        # Look for dual axis indicators in the worksheet XML - more than one
+        # pane is enough, so stop after the second instead of collecting all
+        panes = worksheet.iter("pane")
+        next(panes, None)
+        return next(panes, None) is not None
 
     def _extract_show_labels(self, pane: Element) -> bool:
         """Extract whether data labels are shown."""
-        style_rule = pane.find('.//style-rule[@element="mark"]')
-        if style_rule is not None:
+        style_rules = _XP_MARK_STYLE(pane)
+        if style_rules:
+            style_rule = style_rules[0]
             format_elem = style_rule.find('format[@attr="mark-labels-show"]')
             if format_elem is not None:
                 return format_elem.get("value") == "true"
@@ -3126,15 +3067,14 @@ class TableauXMLParserV2:
     def _extract_show_totals(self, worksheet: Element) -> bool:
         """Extract whether totals are shown."""
         # Look for totals configuration in worksheet
-        totals = worksheet.find(".//totals")
-        return totals is not None
+        return _XP_HAS_TOTALS(worksheet)
 
     def _extract_worksheet_title(self, worksheet: Element) -> str:
         """Extract worksheet title from layout options."""
         # Look for title in layout-options/title/formatted-text/run
-        title_elem = worksheet.find(".//layout-options/title/formatted-text/run")
-        if title_elem is not None and title_elem.text:
-            return title_elem.text.strip()
+        title_elems = _XP_TITLE(worksheet)
+        if title_elems and title_elems[0].text:
+            return title_elems[0].text.strip()
 
         # Fallback to worksheet name if no title found
         worksheet_name = worksheet.get("name", "Untitled")
@@ -3160,27 +3100,12 @@ class TableauXMLParserV2:
         layout_analysis = self._analyze_tableau_layout_structure(main_zones)
 
         # Map Tableau layout patterns to LookML layout types
-        if layout_analysis["has_complex_flows"]:
-            # Mixed horizontal/vertical flows with distribution strategies
-            return "newspaper"
-        elif layout_analysis["primary_flow"] == "horizontal":
-            # Primarily horizontal flow layout
-            return "grid"
-        elif layout_analysis["primary_flow"] == "vertical":
-            # Primarily vertical flow layout (dashboard style)
-            return "newspaper"
-        elif layout_analysis["has_distributed_elements"]:
-            # Elements with distribute-evenly strategy
-            return "newspaper"
-        elif layout_analysis["has_fixed_elements"]:
-            # Elements with fixed positioning
-            return "grid"
-        elif layout_analysis["element_density"] == "high":
-            # Many elements suggest structured layout
-            return "newspaper"
-        else:
-            # Default to free-form for simple/unclear layouts
-            return "free_form"
+        for key, value, layout_type in _LAYOUT_TYPE_RULES:
+            if layout_analysis[key] == value:
+                return layout_type
+
+        # Default to free-form for simple/unclear layouts
+        return "free_form"
 
     def _analyze_tableau_layout_structure(self, main_zones: Element) -> Dict[str, Any]:
         """Analyze Tableau's layout structure to determine optimal LookML layout."""
@@ -3193,52 +3118,64 @@ class TableauXMLParserV2:
             "flow_patterns": [],
         }
 
-        # Find all zones with layout information
-        all_zones = main_zones.findall(".//zone")
-        named_zones = [z for z in all_zones if z.get("name")]
-
-        # Analyze flow layouts
-        flow_zones = [z for z in all_zones if z.get("type-v2") == "layout-flow"]
-        horizontal_flows = [z for z in flow_zones if z.get("param") == "horz"]
-        vertical_flows = [z for z in flow_zones if z.get("param") == "vert"]
-
-        # Analyze distribution strategies
-        distributed_zones = [
-            z for z in all_zones if z.get("layout-strategy-id") == "distribute-evenly"
-        ]
-        fixed_zones = [z for z in all_zones if z.get("is-fixed") == "true"]
+        # Count layout information for all zones in a single pass
+        named_count = 0
+        horizontal_count = 0
+        vertical_count = 0
+        distributed_count = 0
+        fixed_count = 0
+
+        # iter() streams descendants instead of materializing a findall() list
+        for zone in main_zones.iter("zone"):
+            attrib = zone.attrib
+            if attrib.get("name"):
+                named_count += 1
+
+            # Analyze flow layouts
+            if attrib.get("type-v2") == "layout-flow":
+                flow_param = attrib.get("param")
+                if flow_param == "horz":
+                    horizontal_count += 1
+                elif flow_param == "vert":
+                    vertical_count += 1
+
+            # Analyze distribution strategies and fixed positioning
+            if attrib.get("layout-strategy-id") == "distribute-evenly":
+                distributed_count += 1
+            if attrib.get("is-fixed") == "true":
+                fixed_count += 1
 
         # Determine primary flow direction
-        if horizontal_flows and vertical_flows:
+        if horizontal_count and vertical_count:
             analysis["has_complex_flows"] = True
             analysis["primary_flow"] = "mixed"
-        elif len(horizontal_flows) > len(vertical_flows):
+        elif horizontal_count > vertical_count:
             analysis["primary_flow"] = "horizontal"
-        elif len(vertical_flows) > len(horizontal_flows):
+        elif vertical_count > horizontal_count:
             analysis["primary_flow"] = "vertical"
 
         # Check for distribution strategies
-        if distributed_zones:
+        if distributed_count:
             analysis["has_distributed_elements"] = True
 
         # Check for fixed positioning
-        if fixed_zones:
+        if fixed_count:
             analysis["has_fixed_elements"] = True
 
         # Determine element density
-        if len(named_zones) > 8:
+        if named_count > 8:
             analysis["element_density"] = "high"
-        elif len(named_zones) > 4:
+        elif named_count > 4:
             analysis["element_density"] = "medium"
         else:
             analysis["element_density"] = "low"
 
         # Record flow patterns for debugging
         analysis["flow_patterns"] = [
-            {"type": "horizontal", "count": len(horizontal_flows)},
-            {"type": "vertical", "count": len(vertical_flows)},
-            {"type": "distributed", "count": len(distributed_zones)},
-            {"type": "fixed", "count": len(fixed_zones)},
+            {"type": "horizontal", "count": horizontal_count},
+            {"type": "vertical", "count": vertical_count},
+            {"type": "distributed", "count": distributed_count},
+            {"type": "fixed", "count": fixed_count},
         ]
 
         return analysis
@@ -3253,7 +3190,7 @@ class TableauXMLParserV2:
 
         try:
             # Find all filter zones in dashboard
-            filter_zones = dashboard.findall(".//zone[@type-v2='filter']")
+            filter_zones = _XP_FILTER_ZONES(dashboard)
 
             for zone in filter_zones:
                 filter_data = self._parse_filter_zone(zone)
@@ -3292,7 +3229,7 @@ class TableauXMLParserV2:
                 "datasource_id": field_info.get("datasource_id"),
                 "filter_type": "worksheet_card",
                 # Extract ALL attributes generically - no hardcoding
-                **{attr: value for attr, value in card.attrib.items()},
+                **card.attrib,
                 "field_info": field_info,
                 "position_context": self._extract_card_position_context(card),
             }
@@ -3325,11 +3262,9 @@ class TableauXMLParserV2:
                 "datasource_id": field_info.get("datasource_id"),
                 "filter_type": "dashboard_zone",
                 # Extract ALL attributes generically - no hardcoding
-                **{attr: value for attr, value in zone.attrib.items()},
+                **zone.attrib,
                 "field_info": field_info,
-                "position": self._extract_zone_position(zone)
-                if hasattr(self, "_extract_zone_position")
-                else {},
+                "position": self._extract_zone_position(zone),
             }
 
             return filter_config
@@ -3346,42 +3281,27 @@ class TableauXMLParserV2:
         if not param:
             return None
 
-        try:
-            # Generic parsing of complex field references
-            field_info = {
-                "original_param": param,
-                "clean_param": param.strip("[]"),
-            }
-
-            # Handle federated references: [datasource].[field]
-            if "].[" in param:
-                parts = param.split("].[", 1)
-                field_info["datasource_id"] = parts[0].strip("[")
-                field_reference = parts[1].strip("]")
-            else:
-                field_info["datasource_id"] = ""
-                field_reference = param.strip("[]")
-
-            # Parse field components generically: type:name:qualifier
-            components = field_reference.split(":")
-            field_info["components"] = components
-            field_info["field_name"] = (
-                components[1] if len(components) > 1 else field_reference
-            )
-            field_info["field_type"] = components[0] if len(components) > 0 else ""
-            field_info["field_qualifier"] = components[2] if len(components) > 2 else ""
+        # No try/except needed: partition/split on a str cannot fail and every
+        # component index below is guarded by the component count.
+        datasource_id, field_reference, components = _split_field_reference(param)
+        num_components = len(components)
+
+        # Generic parsing of complex field references: type:name:qualifier
+        field_info = {
+            "original_param": param,
+            "clean_param": param.strip("[]"),
+            "datasource_id": datasource_id,
+            "components": list(components),
+            "field_name": components[1] if num_components > 1 else field_reference,
+            "field_type": components[0],
+            "field_qualifier": components[2] if num_components > 2 else "",
+        }
 
-            # Store all components for extensibility
-            if len(components) > 3:
-                field_info["additional_components"] = components[3:]
+        # Store all components for extensibility
+        if num_components > 3:
+            field_info["additional_components"] = list(components[3:])
 
-            return field_info
-
-        except Exception as e:
-            self.logger.warning(
-                f"Failed to parse filter field reference '{param}': {e}"
-            )
-            return None
+        return field_info
 
     def _extract_card_position_context(self, card: Element) -> Dict:
         """Extract positioning context for filter card - generic."""
@@ -3439,7 +3359,7 @@ class TableauXMLParserV2:
                     filter_config[attr] = value
 
             # Parse groupfilter logic
-            groupfilters = filter_elem.findall(".//groupfilter")
+            groupfilters = _XP_GROUPFILTERS(filter_elem)
             for groupfilter in groupfilters:
                 groupfilter_data = self._parse_groupfilter_logic(groupfilter)
                 if groupfilter_data:
@@ -3459,12 +3379,9 @@ class TableauXMLParserV2:
             level = groupfilter.get("level", "")
             member = groupfilter.get("member", "")
 
-            # Decode XML/HTML entities in member value
+            # Decode XML/HTML entities (&quot; -> ") and escaped backslashes
             if member:
-                # First decode HTML entities like &quot; to "
-                member = html.unescape(member)
-                # Then handle escaped backslashes in field names
-                member = member.replace("\\%", "%").replace("\\", "")
+                member = _unescape_filter_value(member)
 
             # Generic extraction of ALL groupfilter attributes
             groupfilter_data = {"function": function, "level": level, "member": member}
@@ -3473,9 +3390,7 @@ class TableauXMLParserV2:
             for attr, value in groupfilter.attrib.items():
                 if attr not in groupfilter_data:
                     if isinstance(value, str) and ("&" in value or "\\" in value):
-                        value = (
-                            html.unescape(value).replace("\\%", "%").replace("\\", "")
-                        )
+                        value = _unescape_filter_value(value)
                     groupfilter_data[attr] = value
 
             # Handle nested groupfilters (for crossjoin, union, etc.)
@@ -3505,25 +3420,21 @@ class TableauXMLParserV2:
         """
         try:
             pane_styling = {}
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            style_count = 0
 
-            # Find all <style> elements within this pane
-            style_elements = pane.findall(".//style")
-
-            if style_elements:
-                self.logger.debug(f"Found {len(style_elements)} style elements in pane")
-
-            for style in style_elements:
-                # Find style-rule elements within this style
-                style_rules = style.findall(".//style-rule")
+            # Stream all <style> elements within this pane
+            for style in pane.iter("style"):
+                style_count += 1
 
-                for rule in style_rules:
+                # Stream style-rule elements within this style
+                for rule in style.iter("style-rule"):
                     element_type = rule.get("element", "unknown")
 
                     # Extract format attributes
-                    formats = rule.findall(".//format")
                     rule_formats = {}
 
-                    for fmt in formats:
+                    for fmt in rule.iter("format"):
                         attr = fmt.get("attr", "")
                         value = fmt.get("value", "")
                         if attr and value:
@@ -3540,13 +3451,20 @@ class TableauXMLParserV2:
                         }
                     )
 
-                    self.logger.debug(
-                        f"Extracted {element_type} styling rule with {len(rule_formats)} formats: {list(rule_formats.keys())}"
-                    )
+                    if debug_enabled:
+                        self.logger.debug(
+                            "Extracted %s styling rule with %d formats: %s",
+                            element_type,
+                            len(rule_formats),
+                            list(rule_formats),
+                        )
+
+            if style_count:
+                self.logger.debug("Found %d style elements in pane", style_count)
 
-            if pane_styling:
+            if pane_styling and debug_enabled:
                 self.logger.debug(
-                    f"Extracted pane styling for elements: {list(pane_styling.keys())}"
+                    "Extracted pane styling for elements: %s", list(pane_styling)
                 )
 
             return pane_styling
@@ -14,6 +14,22 @@ from ..core.field_name_mapper import field_name_mapper
 
 logger = logging.getLogger(__name__)
 
+# Upper-cased formula fragments that indicate a common calculated field pattern
+_COMMON_FORMULA_PATTERNS = ("IF", "CASE", "SUM(", "COUNT(", "AVG(")
+
+# Upper-cased aggregation function calls that suggest a formula needs aggregation
+_AGGREGATION_FUNCTION_PATTERNS = (
+    "SUM(",
+    "COUNT(",
+    "AVG(",
+    "MIN(",
+    "MAX(",
+    "MEDIAN(",
+    "STDEV(",
+    "VAR(",
+    "PERCENTILE(",
+)
+
 
 class CalculatedFieldHandler(BaseHandler):
     """
@@ -87,10 +103,7 @@ class CalculatedFieldHandler(BaseHandler):
 
             # Increase confidence for common formula patterns
             formula = calculation.upper()
-            if any(
-                pattern in formula
-                for pattern in ["IF", "CASE", "SUM(", "COUNT(", "AVG("]
-            ):
+            if any(pattern in formula for pattern in _COMMON_FORMULA_PATTERNS):
                 confidence = 0.9
 
             # Increase confidence for field references
@@ -127,8 +140,6 @@ class CalculatedFieldHandler(BaseHandler):
         # Extract basic field information
         # Prefer user-friendly caption/label over auto-generated Tableau ID
         user_caption = data.get("caption") or data.get("label")
-        if user_caption == "Rolling 24":
-            print(user_caption)
         if user_caption:
             # Use caption for clean field name (convert to snake_case for LookML compatibility)
             field_name = field_name_mapper.create_clean_name_from_caption(user_caption)
@@ -154,9 +165,6 @@ class CalculatedFieldHandler(BaseHandler):
         # Add the field name to our tracking set
         self.used_field_names.add(field_name)
 
-        if field_name == "om_credit_app_numeric":
-            print("here")
-
         # Register the field mapping if we have both original name and clean name
         if original_name and field_name:
             field_name_mapper.register_field(
@@ -458,20 +466,9 @@ class CalculatedFieldHandler(BaseHandler):
         """
         formula_upper = formula.upper()
 
-        # Common aggregation function patterns
-        agg_patterns = [
-            "SUM(",
-            "COUNT(",
-            "AVG(",
-            "MIN(",
-            "MAX(",
-            "MEDIAN(",
-            "STDEV(",
-            "VAR(",
-            "PERCENTILE(",
-        ]
-
-        return any(pattern in formula_upper for pattern in agg_patterns)
+        return any(
+            pattern in formula_upper for pattern in _AGGREGATION_FUNCTION_PATTERNS
+        )
 
     def get_field_dependencies(self, data: Dict) -> List[str]:
         """
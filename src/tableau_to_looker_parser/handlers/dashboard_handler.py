@@ -5,10 +5,23 @@ Transforms the raw dashboard data from xml_parser_v2.extract_dashboards()
 into validated DashboardSchema objects.
 """
 
-from typing import Dict, List
+from typing import ClassVar, Dict, List
 from ..handlers.base_handler import BaseHandler
 from ..models.dashboard_models import DashboardSchema, ElementType
 
+# Direct mapping from raw element_type strings to ElementType
+_ELEMENT_TYPE_MAP = {
+    "worksheet": ElementType.WORKSHEET,
+    "filter": ElementType.FILTER,
+    "parameter": ElementType.PARAMETER,
+    "legend": ElementType.LEGEND,
+    "title": ElementType.TITLE,
+    "text": ElementType.TEXT,
+    "image": ElementType.IMAGE,
+    "web": ElementType.WEB,
+    "blank": ElementType.BLANK,
+}
+
 
 class DashboardHandler(BaseHandler):
     """
@@ -18,6 +31,15 @@ class DashboardHandler(BaseHandler):
     Handles element positioning, styling, and cross-references.
     """
 
+    # Content processor method per element type; other types carry no content
+    _CONTENT_PROCESSORS: ClassVar[Dict[ElementType, str]] = {
+        ElementType.WORKSHEET: "_process_worksheet_content",
+        ElementType.FILTER: "_process_filter_content",
+        ElementType.PARAMETER: "_process_parameter_content",
+        ElementType.TEXT: "_process_text_content",
+        ElementType.IMAGE: "_process_image_content",
+    }
+
     def can_handle(self, data: Dict) -> float:
         """Check if data contains dashboard information."""
         if not isinstance(data, dict):
@@ -106,7 +128,7 @@ class DashboardHandler(BaseHandler):
 
         # Validate with Pydantic schema
         try:
-            dashboard = DashboardSchema(**dashboard_data)
+            dashboard = DashboardSchema.model_validate(dashboard_data)
             return dashboard.model_dump()
 
         except Exception as e:
@@ -170,21 +192,9 @@ class DashboardHandler(BaseHandler):
         """Determine the element type from raw data."""
         element_type_str = raw_element.get("element_type", "").lower()
 
-        # Direct mapping
-        type_mapping = {
-            "worksheet": ElementType.WORKSHEET,
-            "filter": ElementType.FILTER,
-            "parameter": ElementType.PARAMETER,
-            "legend": ElementType.LEGEND,
-            "title": ElementType.TITLE,
-            "text": ElementType.TEXT,
-            "image": ElementType.IMAGE,
-            "web": ElementType.WEB,
-            "blank": ElementType.BLANK,
-        }
-
-        if element_type_str in type_mapping:
-            return type_mapping[element_type_str]
+        element_type = _ELEMENT_TYPE_MAP.get(element_type_str)
+        if element_type is not None:
+            return element_type
 
         # Infer from content
         if "worksheet_name" in raw_element:
@@ -230,51 +240,65 @@ class DashboardHandler(BaseHandler):
         self, raw_element: Dict, element_type: ElementType
     ) -> Dict:
         """Process element content based on its type."""
-        content_data = {}
-
-        if element_type == ElementType.WORKSHEET:
-            # For worksheet elements, we just store the reference
-            # The actual WorksheetSchema will be populated by the migration engine
-            content_data["worksheet"] = None  # Will be populated later
-
-            # Store worksheet name for reference
-            if "worksheet_name" in raw_element:
-                content_data["custom_content"] = {
-                    "worksheet_name": raw_element["worksheet_name"]
-                }
-
-        elif element_type == ElementType.FILTER:
-            filter_config = raw_element.get("filter_config", {})
-            content_data["filter_config"] = {
+        processor_name = self._CONTENT_PROCESSORS.get(element_type)
+        if processor_name is None:
+            return {}
+        return getattr(self, processor_name)(raw_element)
+
+    def _process_worksheet_content(self, raw_element: Dict) -> Dict:
+        """Process worksheet element content."""
+        # For worksheet elements, we just store the reference
+        # The actual WorksheetSchema will be populated by the migration engine
+        content_data = {"worksheet": None}  # Will be populated later
+
+        # Store worksheet name for reference
+        if "worksheet_name" in raw_element:
+            content_data["custom_content"] = {
+                "worksheet_name": raw_element["worksheet_name"]
+            }
+
+        return content_data
+
+    def _process_filter_content(self, raw_element: Dict) -> Dict:
+        """Process filter element content."""
+        filter_config = raw_element.get("filter_config", {})
+        return {
+            "filter_config": {
                 "filter_type": filter_config.get("filter_type", "field_filter"),
                 "field": filter_config.get("field", ""),
                 "filter_values": filter_config.get("filter_values", []),
                 "is_multiple_select": filter_config.get("is_multiple_select", True),
                 "show_apply_button": filter_config.get("show_apply_button", False),
             }
+        }
 
-        elif element_type == ElementType.PARAMETER:
-            param_config = raw_element.get("parameter_config", {})
-            content_data["parameter_config"] = {
+    def _process_parameter_content(self, raw_element: Dict) -> Dict:
+        """Process parameter element content."""
+        param_config = raw_element.get("parameter_config", {})
+        return {
+            "parameter_config": {
                 "parameter_name": param_config.get("parameter_name", ""),
                 "data_type": param_config.get("data_type", "string"),
                 "default_value": param_config.get("default_value"),
                 "allowed_values": param_config.get("allowed_values", []),
                 "control_type": param_config.get("control_type", "dropdown"),
             }
+        }
 
-        elif element_type == ElementType.TEXT:
-            content_data["text_content"] = raw_element.get("text_content", "")
+    def _process_text_content(self, raw_element: Dict) -> Dict:
+        """Process text element content."""
+        return {"text_content": raw_element.get("text_content", "")}
 
-        elif element_type == ElementType.IMAGE:
-            image_config = raw_element.get("image_config", {})
-            content_data["image_config"] = {
+    def _process_image_content(self, raw_element: Dict) -> Dict:
+        """Process image element content."""
+        image_config = raw_element.get("image_config", {})
+        return {
+            "image_config": {
                 "image_url": image_config.get("image_url", ""),
                 "alt_text": image_config.get("alt_text", ""),
                 "fit_mode": image_config.get("fit_mode", "fit"),
             }
-
-        return content_data
+        }
 
     def _process_global_filters(self, raw_filters: List[Dict]) -> List[Dict]:
         """Process raw global filter data."""
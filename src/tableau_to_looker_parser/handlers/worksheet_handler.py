@@ -6,6 +6,7 @@ into validated WorksheetSchema objects.
 """
 
 import logging
+import re
 from typing import Dict, List, Optional, Any
 from ..handlers.base_handler import BaseHandler
 from ..models.worksheet_models import WorksheetSchema, ChartType
@@ -14,6 +15,15 @@ from ..core.field_derivation_engine import FieldDerivationEngine
 
 logger = logging.getLogger(__name__)
 
+# Substrings in a lowercased field name that suggest a join key
+_JOIN_KEYWORD_RE = re.compile(r"id|key|code")
+
+# Substrings in a lowercased worksheet name that suggest a text/placeholder sheet
+_TEXT_WORKSHEET_RE = re.compile(
+    r"notice|text|title|header|footer|label|placeholder|blank|spacer|divider"
+    r"|instruction|filter|refresh"
+)
+
 
 class WorksheetHandler(BaseHandler):
     """
@@ -742,7 +752,7 @@ class WorksheetHandler(BaseHandler):
         if "federated" in datasource_id:
             return "Orders"  # Most common case in our samples
 
-        return datasource_id.split(".")[-1] if "." in datasource_id else datasource_id
+        return datasource_id.rpartition(".")[2]
 
     def _extract_calculated_fields(self, fields: List[Dict]) -> List[str]:
         """Extract names of calculated fields from field list."""
@@ -774,7 +784,7 @@ class WorksheetHandler(BaseHandler):
         # Look for fields that might indicate joins
         for field in fields:
             field_name = field.get("name", "").lower()
-            if any(keyword in field_name for keyword in ["id", "key", "code"]):
+            if _JOIN_KEYWORD_RE.search(field_name):
                 # This might be a foreign key
                 table_name = (
                     field_name.replace("_id", "")
@@ -886,23 +896,7 @@ class WorksheetHandler(BaseHandler):
         name = data.get("name", "").lower()
 
         # Check for common text/placeholder names
-        text_indicators = [
-            "notice",
-            "text",
-            "title",
-            "header",
-            "footer",
-            "label",
-            "placeholder",
-            "blank",
-            "spacer",
-            "divider",
-            "instruction",
-            "filter",
-            "refresh",
-        ]
-
-        name_matches_indicator = any(indicator in name for indicator in text_indicators)
+        name_matches_indicator = _TEXT_WORKSHEET_RE.search(name) is not None
 
         # Check if worksheet has no meaningful visualization data
         viz = data.get("visualization", {})